@@ -5,16 +5,21 @@ Flask web server for Home Screen & Vehicle Status feature.
 """
 
 import os
+from typing import Optional
 from flask import Flask, render_template, jsonify, request
 from models import VehicleState, UserProfile
 from models.remote_command import RemoteCommand
-from models.climate_settings import ClimateSettings
+from models.climate_settings import (
+    ClimateSettings, TEMP_MIN_CELSIUS, TEMP_MAX_CELSIUS
+)
 from models.enums import CommandType, SeatHeatLevel
 from services import safe_read_json, atomic_write_json, ensure_directory
+from services.json_provider import OrjsonProvider
 from mocks import VehicleDataMockService
 from mocks.remote_command_mock import RemoteCommandMockService
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
 # Paths for data persistence
@@ -22,18 +27,42 @@ DATA_DIR = 'data'
 VEHICLE_STATE_FILE = os.path.join(DATA_DIR, 'vehicle_state.json')
 USER_PROFILE_FILE = os.path.join(DATA_DIR, 'user_settings.json')
 
+# Error returned when a requested cabin temperature is outside the valid range
+TEMP_RANGE_ERROR = (
+    f'Temperature must be between {TEMP_MIN_CELSIUS:g}°C and {TEMP_MAX_CELSIUS:g}°C'
+)
+
+# In-memory mirror of the last snapshot written to VEHICLE_STATE_FILE,
+# so cached reads never go back to disk
+_vehicle_state_snapshot: Optional[dict] = None
+
+# Authoritative in-memory user profile; loaded from USER_PROFILE_FILE once
+# and replaced on every successful save
+_user_profile: Optional[UserProfile] = None
+
 
 def cache_vehicle_state(state: VehicleState) -> bool:
-    """Save vehicle state to cache file."""
+    """Save vehicle state to cache file, skipping writes when nothing changed."""
+    global _vehicle_state_snapshot
+    data = state.to_dict()
+    if data == _vehicle_state_snapshot:
+        # Status polls re-cache an unchanged state; avoid rewriting the file
+        return True
     ensure_directory(VEHICLE_STATE_FILE)
-    return atomic_write_json(VEHICLE_STATE_FILE, state.to_dict())
+    if not atomic_write_json(VEHICLE_STATE_FILE, data):
+        # Leave the snapshot alone so the same state is retried next time
+        return False
+    _vehicle_state_snapshot = data
+    return True
 
 
 def get_or_create_initial_state() -> VehicleState:
     """Get cached state or create new one."""
+    global _vehicle_state_snapshot
     ensure_directory(VEHICLE_STATE_FILE)
     data = safe_read_json(VEHICLE_STATE_FILE)
     if data:
+        _vehicle_state_snapshot = data
         return VehicleState.from_dict(data)
     # Create new state and cache it
     from mocks.vehicle_data_mock import VehicleDataMockService
@@ -57,32 +86,54 @@ vehicle_service = VehicleDataMockService(
     initial_state=shared_vehicle_state
 )
 
+
+def create_remote_command_service(state: VehicleState) -> RemoteCommandMockService:
+    """Create the remote command mock service operating on the given state."""
+    return RemoteCommandMockService(
+        vehicle_state=state,
+        success_rate=1.0,  # 100% success by default, toggle via UI
+        min_delay_ms=1000,
+        max_delay_ms=2500
+    )
+
+
 # Initialize remote command service with same shared state
-remote_command_service = RemoteCommandMockService(
-    vehicle_state=shared_vehicle_state,
-    success_rate=1.0,  # 100% success by default, toggle via UI
-    min_delay_ms=1000,
-    max_delay_ms=2500
+remote_command_service: Optional[RemoteCommandMockService] = create_remote_command_service(
+    shared_vehicle_state
 )
 
 
+def get_remote_command_service() -> RemoteCommandMockService:
+    """Return the remote command service, recreating it on the shared state if reset."""
+    global remote_command_service
+    if remote_command_service is None:
+        remote_command_service = create_remote_command_service(shared_vehicle_state)
+    return remote_command_service
+
+
 def get_user_profile() -> UserProfile:
-    """Load user profile from data file or return default."""
-    ensure_directory(USER_PROFILE_FILE)
-    data = safe_read_json(USER_PROFILE_FILE)
-    if data:
-        return UserProfile.from_dict(data)
-    return UserProfile.get_default()
+    """Return the in-memory user profile, loading it from the data file once."""
+    global _user_profile
+    if _user_profile is None:
+        data = safe_read_json(USER_PROFILE_FILE)
+        _user_profile = UserProfile.from_dict(data) if data else UserProfile.get_default()
+    return _user_profile
 
 
 def save_user_profile(profile: UserProfile) -> bool:
-    """Save user profile to data file."""
+    """Save user profile to data file and make it the in-memory profile."""
+    global _user_profile
     ensure_directory(USER_PROFILE_FILE)
-    return atomic_write_json(USER_PROFILE_FILE, profile.to_dict())
+    if not atomic_write_json(USER_PROFILE_FILE, profile.to_dict()):
+        return False
+    _user_profile = profile
+    return True
 
 
 def get_cached_vehicle_state() -> VehicleState:
-    """Load cached vehicle state from data file."""
+    """Load cached vehicle state from memory, falling back to the data file."""
+    if _vehicle_state_snapshot is not None:
+        return VehicleState.from_dict(_vehicle_state_snapshot)
     ensure_directory(VEHICLE_STATE_FILE)
     data = safe_read_json(VEHICLE_STATE_FILE)
     if data:
@@ -222,12 +273,13 @@ def toggle_mock_mode():
         fail_mode = data.get('fail_mode', False)
         
         # Set success rate: 0.0 for fail mode, 1.0 for success mode
-        remote_command_service.success_rate = 0.0 if fail_mode else 1.0
+        service = get_remote_command_service()
+        service.success_rate = 0.0 if fail_mode else 1.0
         
         return jsonify({
             'success': True,
             'fail_mode': fail_mode,
-            'success_rate': remote_command_service.success_rate
+            'success_rate': service.success_rate
         })
     except Exception as e:
         return jsonify({
@@ -240,12 +292,13 @@ def toggle_mock_mode():
 def get_mock_status():
     """Get current mock service configuration."""
     try:
-        fail_mode = remote_command_service.success_rate == 0.0
+        service = get_remote_command_service()
+        fail_mode = service.success_rate == 0.0
         
         return jsonify({
             'success': True,
             'fail_mode': fail_mode,
-            'success_rate': remote_command_service.success_rate
+            'success_rate': service.success_rate
         })
     except Exception as e:
         return jsonify({
@@ -258,7 +311,7 @@ def get_mock_status():
 def lock_vehicle():
     """Lock vehicle doors."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         command = RemoteCommand(command_type=CommandType.LOCK)
         
         result = service.send_command(command)
@@ -287,7 +340,7 @@ def lock_vehicle():
 def unlock_vehicle():
     """Unlock vehicle doors."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         command = RemoteCommand(command_type=CommandType.UNLOCK)
         
         result = service.send_command(command)
@@ -316,7 +369,7 @@ def get_command_status(command_id):
     """Get status of a remote command."""
     try:
         from uuid import UUID
-        service = remote_command_service
+        service = get_remote_command_service()
         
         command = service.get_command_status(UUID(command_id))
         
@@ -346,7 +399,7 @@ def get_command_status(command_id):
 def control_climate():
     """Start or stop climate control."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         data = request.get_json() or {}
         
         # Get the action (start/stop)
@@ -364,10 +417,10 @@ def control_climate():
             temp = data.get('temperature', 21.0)
             
             # Validate temperature range
-            if not 15.0 <= temp <= 28.0:
+            if not TEMP_MIN_CELSIUS <= temp <= TEMP_MAX_CELSIUS:
                 return jsonify({
                     'success': False,
-                    'error': 'Temperature must be between 15°C and 28°C'
+                    'error': TEMP_RANGE_ERROR
                 }), 400
             
             # Build climate settings
@@ -428,7 +481,7 @@ def control_climate():
 def update_climate():
     """Update climate control settings while running."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         data = request.get_json() or {}
         
         # Check if climate is currently active
@@ -445,10 +498,10 @@ def update_climate():
         temp = data.get('temperature', current.target_temp_celsius)
         
         # Validate temperature range
-        if not 15.0 <= temp <= 28.0:
+        if not TEMP_MIN_CELSIUS <= temp <= TEMP_MAX_CELSIUS:
             return jsonify({
                 'success': False,
-                'error': 'Temperature must be between 15°C and 28°C'
+                'error': TEMP_RANGE_ERROR
             }), 400
         
         # Build updated climate settings
@@ -501,7 +554,7 @@ def update_climate():
 def control_seat_heat():
     """Control heated seats."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         data = request.get_json() or {}
         
         # Check if climate is on
@@ -563,7 +616,7 @@ def control_seat_heat():
 def control_steering_heat():
     """Control heated steering wheel."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         data = request.get_json() or {}
         
         # Check if climate is on
@@ -608,7 +661,7 @@ def control_steering_heat():
 def control_defrost():
     """Control defrost (front/rear)."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         data = request.get_json() or {}
         
         # Check if climate is on
@@ -661,7 +714,7 @@ def control_defrost():
 def open_trunk():
     """Open rear trunk."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         
         # Safety check: reject if vehicle is moving
         if service.vehicle_state.speed_mph > 0:
@@ -702,7 +755,7 @@ def open_trunk():
 def open_frunk():
     """Open front trunk (frunk)."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         
         # Safety check: reject if vehicle is moving
         if service.vehicle_state.speed_mph > 0:
@@ -743,7 +796,7 @@ def open_frunk():
 def honk_flash():
     """Honk horn and flash lights to locate vehicle."""
     try:
-        service = remote_command_service
+        service = get_remote_command_service()
         
         # Create and send command
         command = RemoteCommand(
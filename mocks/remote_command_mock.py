@@ -7,8 +7,10 @@ and state changes for development and testing without a real vehicle.
 
 import time
 import random
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict, List
 from uuid import UUID
 
 from models.remote_command import RemoteCommand
@@ -16,7 +18,40 @@ from models.enums import CommandType, CommandStatus, LockStatus, SeatHeatLevel
 from models.vehicle_state import VehicleState
 from services.remote_command_service import RemoteCommandService
 from services.command_queue import CommandQueue
-from services.data_persistence import save_command_history, load_command_history
+from services.data_persistence import (
+    save_command_history, append_command_history, load_command_history
+)
+
+# Command groups checked on every send_command (hashed, allocated once)
+_CLIMATE_CMDS = frozenset({CommandType.CLIMATE_ON, CommandType.SET_TEMP})
+_TRUNK_CMDS = frozenset({CommandType.TRUNK_OPEN, CommandType.FRUNK_OPEN})
+
+# State each command leaves behind; a command whose target state already
+# holds is rejected, and batches validate later commands against it
+_LOCK_RESULTS = {CommandType.LOCK: LockStatus.LOCKED, CommandType.UNLOCK: LockStatus.UNLOCKED}
+_CLIMATE_RESULTS = {CommandType.CLIMATE_ON: True, CommandType.CLIMATE_OFF: False}
+
+
+def _check_target_state(
+    command: RemoteCommand,
+    lock_status: LockStatus,
+    climate_on: bool
+) -> None:
+    """
+    Reject lock and climate commands whose target state is already reached.
+    
+    Args:
+        command: RemoteCommand to check
+        lock_status: Lock status the command would run against
+        climate_on: Climate state the command would run against
+        
+    Raises:
+        ValueError: If the vehicle is already in the command's target state
+    """
+    if _LOCK_RESULTS.get(command.command_type) == lock_status:
+        raise ValueError(f"Vehicle is already {lock_status.value}")
+    if _CLIMATE_RESULTS.get(command.command_type) == climate_on:
+        raise ValueError(f"Climate control is already {'on' if climate_on else 'off'}")
 
 
 class RemoteCommandMockService(RemoteCommandService):
@@ -30,11 +65,15 @@ class RemoteCommandMockService(RemoteCommandService):
     - Battery drain simulation for climate commands
     - Command history persistence
     
+    Commands execute synchronously inside send_command; concurrent callers
+    are serialized, each draining the queue in turn.
+    
     Attributes:
         vehicle_state: Current vehicle state to modify
         success_rate: Probability of command success (0.0-1.0)
         min_delay_ms: Minimum simulated command delay
         max_delay_ms: Maximum simulated command delay
+        history_limit: Maximum number of commands kept in history
     """
     
     def __init__(
@@ -42,7 +81,8 @@ class RemoteCommandMockService(RemoteCommandService):
         vehicle_state: VehicleState,
         success_rate: float = 0.95,
         min_delay_ms: int = 1000,
-        max_delay_ms: int = 3000
+        max_delay_ms: int = 3000,
+        history_limit: int = 1024
     ) -> None:
         """
         Initialize mock service.
@@ -52,17 +92,31 @@ class RemoteCommandMockService(RemoteCommandService):
             success_rate: Probability of command success (default 95%)
             min_delay_ms: Minimum delay in milliseconds
             max_delay_ms: Maximum delay in milliseconds
+            history_limit: Maximum commands kept in history; oldest are evicted
+        
+        Raises:
+            ValueError: If history_limit is less than 1
         """
+        if history_limit < 1:
+            raise ValueError("history_limit must be at least 1")
+        
         self.vehicle_state = vehicle_state
         self.success_rate = success_rate
         self.min_delay_ms = min_delay_ms
         self.max_delay_ms = max_delay_ms
         
+        self.history_limit = history_limit
+        
         self._command_queue = CommandQueue()
+        # Bounded history in arrival order, plus an ID index for status lookups
+        self._history: deque[RemoteCommand] = deque(maxlen=history_limit)
         self._command_history: Dict[UUID, RemoteCommand] = {}
         
         # Load persisted command history
         self._load_history()
+        
+        # Only one thread drains the queue at a time, however many produce
+        self._drain_lock = threading.Lock()
     
     def send_command(self, command: RemoteCommand) -> RemoteCommand:
         """
@@ -80,18 +134,47 @@ class RemoteCommandMockService(RemoteCommandService):
         Raises:
             ValueError: If command is invalid or vehicle state prevents execution
         """
-        # Validate command before enqueuing
-        self._validate_command(command)
+        # Validate and enqueue under the drain lock, so a concurrent caller's
+        # command has fully executed before ours is checked against the state
+        with self._drain_lock:
+            self._validate_command(command)
+            
+            self._command_queue.enqueue(command)
+            self._remember(command)
+            
+            # Execute synchronously
+            self._drain_queue()
         
-        # Enqueue command
-        self._command_queue.enqueue(command)
-        self._command_history[command.command_id] = command
+        return command
+    
+    def send_commands(self, commands: List[RemoteCommand]) -> List[RemoteCommand]:
+        """
+        Send several commands for execution in one batch (simulated).
         
-        # Execute immediately if no other commands pending
-        if self._command_queue.size() == 1:
-            self._execute_next()
+        Every command is validated before any is enqueued, each against the
+        state the earlier commands in the batch will leave, so [LOCK, UNLOCK]
+        is accepted but [LOCK, LOCK] rejects the whole batch. The batch is
+        then drained in one pass and its history written in one append.
         
-        return command
+        Args:
+            commands: RemoteCommands to execute, in order
+            
+        Returns:
+            The commands with updated status, in the same order
+            
+        Raises:
+            ValueError: If any command is invalid or vehicle state prevents execution
+        """
+        with self._drain_lock:
+            self._validate_batch(commands)
+            
+            for command in commands:
+                self._command_queue.enqueue(command)
+                self._remember(command)
+            
+            self._drain_queue()
+        
+        return commands
     
     def get_command_status(self, command_id: UUID) -> Optional[RemoteCommand]:
         """
@@ -127,137 +210,96 @@ class RemoteCommandMockService(RemoteCommandService):
         Raises:
             ValueError: If command is invalid or unsafe
         """
+        self._check_preconditions(command)
+        _check_target_state(
+            command, self.vehicle_state.lock_status, self.vehicle_state.climate_on
+        )
+    
+    def _validate_batch(self, commands: List[RemoteCommand]) -> None:
+        """
+        Validate each command against the state earlier commands in the batch leave.
+        
+        Args:
+            commands: RemoteCommands to validate, in execution order
+            
+        Raises:
+            ValueError: If any command is invalid or unsafe
+        """
+        lock_status = self.vehicle_state.lock_status
+        climate_on = self.vehicle_state.climate_on
+        for command in commands:
+            self._check_preconditions(command)
+            _check_target_state(command, lock_status, climate_on)
+            lock_status = _LOCK_RESULTS.get(command.command_type, lock_status)
+            climate_on = _CLIMATE_RESULTS.get(command.command_type, climate_on)
+    
+    def _check_preconditions(self, command: RemoteCommand) -> None:
+        """
+        Check the battery and speed conditions a command requires.
+        
+        Args:
+            command: RemoteCommand to check
+            
+        Raises:
+            ValueError: If the vehicle cannot run the command
+        """
         # Check battery level for climate commands
-        if command.command_type in [CommandType.CLIMATE_ON, CommandType.SET_TEMP]:
+        if command.command_type in _CLIMATE_CMDS:
             if self.vehicle_state.battery_soc < 10.0:
                 raise ValueError("Battery too low (<10%) for climate control")
         
-        # Check if already in target state for climate
-        if command.command_type == CommandType.CLIMATE_ON:
-            if self.vehicle_state.climate_on:
-                raise ValueError("Climate control is already on")
-        elif command.command_type == CommandType.CLIMATE_OFF:
-            if not self.vehicle_state.climate_on:
-                raise ValueError("Climate control is already off")
-        
         # Check vehicle speed for trunk/frunk commands
-        if command.command_type in [CommandType.TRUNK_OPEN, CommandType.FRUNK_OPEN]:
+        if command.command_type in _TRUNK_CMDS:
             if self.vehicle_state.speed_mph > 0:
                 raise ValueError("Cannot open trunk/frunk while vehicle is moving")
-        
-        # Check if already in target state
-        if command.command_type == CommandType.LOCK:
-            if self.vehicle_state.lock_status == LockStatus.LOCKED:
-                raise ValueError("Vehicle is already locked")
-        elif command.command_type == CommandType.UNLOCK:
-            if self.vehicle_state.lock_status == LockStatus.UNLOCKED:
-                raise ValueError("Vehicle is already unlocked")
     
-    def _execute_next(self) -> None:
-        """Execute the next command in the queue."""
-        command = self._command_queue.dequeue()
-        if not command:
-            return
-        
-        self._command_queue.set_executing(command)
-        
-        # Simulate execution delay
-        delay_ms = random.randint(self.min_delay_ms, self.max_delay_ms)
-        time.sleep(delay_ms / 1000.0)
-        
-        # Simulate success/failure
-        if random.random() < self.success_rate:
-            self._execute_command(command, delay_ms)
-        else:
-            command.mark_failed("Simulated failure", delay_ms)
+    def _drain_queue(self) -> None:
+        """
+        Execute queued commands one at a time until the queue is empty.
         
-        self._command_queue.set_executing(None)
+        History is persisted once per drain rather than after every
+        command, so a burst of queued commands costs a single write.
+        """
+        completed: List[RemoteCommand] = []
+        while True:
+            command = self._command_queue.dequeue()
+            if not command:
+                break
+            
+            self._command_queue.set_executing(command)
+            
+            # Simulate execution delay
+            delay_ms = random.randint(self.min_delay_ms, self.max_delay_ms)
+            time.sleep(delay_ms / 1000.0)
+            
+            # Simulate success/failure
+            if random.random() < self.success_rate:
+                self._execute_command(command, delay_ms)
+            else:
+                command.mark_failed("Simulated failure", delay_ms)
+            
+            self._command_queue.set_executing(None)
+            completed.append(command)
         
         # Save updated history
-        self._save_history()
-        
-        # Execute next command if queue not empty
-        if not self._command_queue.is_empty():
-            self._execute_next()
+        if completed:
+            self._save_history(completed)
     
     def _execute_command(self, command: RemoteCommand, delay_ms: int) -> None:
         """
         Execute command and update vehicle state.
         
+        Dispatches through the _HANDLERS table (one dict lookup per command).
+        
         Args:
             command: RemoteCommand to execute
             delay_ms: Simulated execution time
         """
-        cmd_type = command.command_type
+        handler = self._HANDLERS.get(command.command_type)
         
         try:
-            if cmd_type == CommandType.LOCK:
-                self.vehicle_state.lock_status = LockStatus.LOCKED
-                self.vehicle_state.lock_timestamp = datetime.now()
-            
-            elif cmd_type == CommandType.UNLOCK:
-                self.vehicle_state.lock_status = LockStatus.UNLOCKED
-                self.vehicle_state.lock_timestamp = datetime.now()
-            
-            elif cmd_type == CommandType.CLIMATE_ON:
-                self.vehicle_state.climate_on = True
-                self.vehicle_state.climate_settings.is_active = True
-                if 'target_temp' in command.parameters:
-                    temp = command.parameters['target_temp']
-                    self.vehicle_state.climate_settings.set_temperature(temp)
-            
-            elif cmd_type == CommandType.CLIMATE_OFF:
-                self.vehicle_state.climate_on = False
-                self.vehicle_state.climate_settings.is_active = False
-            
-            elif cmd_type == CommandType.SET_TEMP:
-                if 'target_temp' in command.parameters:
-                    temp = command.parameters['target_temp']
-                    self.vehicle_state.climate_settings.set_temperature(temp)
-            
-            elif cmd_type == CommandType.SEAT_HEAT:
-                seat = command.parameters.get('seat', 'front_left')
-                level = SeatHeatLevel(command.parameters.get('level', 'off'))
-                if seat == 'front_left':
-                    self.vehicle_state.climate_settings.front_left_seat_heat = level
-                elif seat == 'front_right':
-                    self.vehicle_state.climate_settings.front_right_seat_heat = level
-                elif seat == 'rear':
-                    self.vehicle_state.climate_settings.rear_seat_heat = level
-            
-            elif cmd_type == CommandType.STEERING_HEAT:
-                enabled = command.parameters.get('enabled', False)
-                self.vehicle_state.climate_settings.steering_wheel_heat = enabled
-            
-            elif cmd_type == CommandType.DEFROST:
-                position = command.parameters.get('position', 'front')
-                enabled = command.parameters.get('enabled', False)
-                if position == 'front':
-                    self.vehicle_state.climate_settings.front_defrost = enabled
-                elif position == 'rear':
-                    self.vehicle_state.climate_settings.rear_defrost = enabled
-            
-            elif cmd_type == CommandType.TRUNK_OPEN:
-                self.vehicle_state.trunk_status.rear_trunk_open = True
-            
-            elif cmd_type == CommandType.FRUNK_OPEN:
-                self.vehicle_state.trunk_status.front_trunk_open = True
-            
-            elif cmd_type == CommandType.HONK_FLASH:
-                # Honk and flash don't modify state, just log success
-                pass
-            
-            # Simulate battery drain for climate operations
-            if cmd_type == CommandType.CLIMATE_ON:
-                drain = self.vehicle_state.climate_settings.estimate_battery_drain_per_10min(
-                    self.vehicle_state.cabin_temp_celsius
-                )
-                # Apply 1/60th of 10-min drain per second of execution
-                simulated_drain = drain * (delay_ms / 1000.0) / 600.0
-                self.vehicle_state.battery_soc = max(
-                    0.0,
-                    self.vehicle_state.battery_soc - simulated_drain
-                )
+            if handler is not None:
+                handler(self, command, delay_ms)
             
             # Update vehicle state timestamp
             self.vehicle_state.last_updated = datetime.now()
@@ -268,18 +310,143 @@ class RemoteCommandMockService(RemoteCommandService):
         except Exception as e:
             command.mark_failed(str(e), delay_ms)
     
-    def _save_history(self) -> None:
-        """Persist command history to disk."""
-        history_data = [cmd.to_dict() for cmd in self._command_history.values()]
-        save_command_history(history_data)
+    def _apply_lock(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Lock the vehicle."""
+        self.vehicle_state.lock_status = LockStatus.LOCKED
+        self.vehicle_state.lock_timestamp = datetime.now()
+    
+    def _apply_unlock(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Unlock the vehicle."""
+        self.vehicle_state.lock_status = LockStatus.UNLOCKED
+        self.vehicle_state.lock_timestamp = datetime.now()
+    
+    def _apply_climate_on(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Start climate control and simulate the resulting battery drain."""
+        self.vehicle_state.climate_on = True
+        self.vehicle_state.climate_settings.is_active = True
+        if 'target_temp' in command.parameters:
+            temp = command.parameters['target_temp']
+            self.vehicle_state.climate_settings.set_temperature(temp)
+        
+        drain = self.vehicle_state.climate_settings.estimate_battery_drain_per_10min(
+            self.vehicle_state.cabin_temp_celsius
+        )
+        # Apply 1/60th of 10-min drain per second of execution
+        simulated_drain = drain * (delay_ms / 1000.0) / 600.0
+        self.vehicle_state.battery_soc = max(
+            0.0,
+            self.vehicle_state.battery_soc - simulated_drain
+        )
+    
+    def _apply_climate_off(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Stop climate control."""
+        self.vehicle_state.climate_on = False
+        self.vehicle_state.climate_settings.is_active = False
+    
+    def _apply_set_temp(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Change the target cabin temperature."""
+        if 'target_temp' in command.parameters:
+            temp = command.parameters['target_temp']
+            self.vehicle_state.climate_settings.set_temperature(temp)
+    
+    def _apply_seat_heat(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Set the heat level of one seat."""
+        seat = command.parameters.get('seat', 'front_left')
+        level = SeatHeatLevel(command.parameters.get('level', 'off'))
+        if seat == 'front_left':
+            self.vehicle_state.climate_settings.front_left_seat_heat = level
+        elif seat == 'front_right':
+            self.vehicle_state.climate_settings.front_right_seat_heat = level
+        elif seat == 'rear':
+            self.vehicle_state.climate_settings.rear_seat_heat = level
+    
+    def _apply_steering_heat(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Toggle the heated steering wheel."""
+        enabled = command.parameters.get('enabled', False)
+        self.vehicle_state.climate_settings.steering_wheel_heat = enabled
+    
+    def _apply_defrost(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Toggle front or rear defrost."""
+        position = command.parameters.get('position', 'front')
+        enabled = command.parameters.get('enabled', False)
+        if position == 'front':
+            self.vehicle_state.climate_settings.front_defrost = enabled
+        elif position == 'rear':
+            self.vehicle_state.climate_settings.rear_defrost = enabled
+    
+    def _apply_trunk_open(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Open the rear trunk."""
+        self.vehicle_state.trunk_status.rear_trunk_open = True
+    
+    def _apply_frunk_open(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Open the front trunk."""
+        self.vehicle_state.trunk_status.front_trunk_open = True
+    
+    def _apply_honk_flash(self, command: RemoteCommand, delay_ms: int) -> None:
+        """Honk and flash don't modify state, just log success."""
+    
+    # CommandType -> state handler, built once at class definition
+    _HANDLERS: Dict[CommandType, Callable[..., None]] = {
+        CommandType.LOCK: _apply_lock,
+        CommandType.UNLOCK: _apply_unlock,
+        CommandType.CLIMATE_ON: _apply_climate_on,
+        CommandType.CLIMATE_OFF: _apply_climate_off,
+        CommandType.SET_TEMP: _apply_set_temp,
+        CommandType.SEAT_HEAT: _apply_seat_heat,
+        CommandType.STEERING_HEAT: _apply_steering_heat,
+        CommandType.DEFROST: _apply_defrost,
+        CommandType.TRUNK_OPEN: _apply_trunk_open,
+        CommandType.FRUNK_OPEN: _apply_frunk_open,
+        CommandType.HONK_FLASH: _apply_honk_flash,
+    }
+    
+    def _remember(self, command: RemoteCommand) -> None:
+        """
+        Add command to the bounded history, evicting the oldest when full.
+        
+        Eviction ignores status: a still-queued command pushed out (e.g. by a
+        send_commands batch larger than history_limit) executes normally but
+        is no longer visible to get_command_status.
+        
+        Args:
+            command: RemoteCommand to record
+        """
+        if len(self._history) == self._history.maxlen:
+            evicted = self._history[0]
+            if self._command_history.get(evicted.command_id) is evicted:
+                del self._command_history[evicted.command_id]
+        self._history.append(command)
+        self._command_history[command.command_id] = command
+    
+    def _save_history(self, completed: List[RemoteCommand]) -> None:
+        """
+        Append newly completed commands to the on-disk history log.
+        
+        Once the log holds more than twice history_limit entries it is
+        compacted to the current in-memory history.
+        
+        Args:
+            completed: Commands that finished executing since the last save
+        """
+        self._logged_entries += len(completed)
+        if self._logged_entries > 2 * self.history_limit:
+            commands = [
+                cmd for cmd in self._history
+                if cmd.status != CommandStatus.PENDING
+            ]
+            save_command_history(commands)
+            self._logged_entries = len(commands)
+        else:
+            append_command_history(completed)
     
     def _load_history(self) -> None:
         """Load command history from disk."""
         history_data = load_command_history()
+        self._logged_entries = len(history_data)
         for cmd_dict in history_data:
             try:
                 cmd = RemoteCommand.from_dict(cmd_dict)
-                self._command_history[cmd.command_id] = cmd
             except Exception:
                 # Skip invalid history entries
-                pass
+                continue
+            self._remember(cmd)
@@ -56,22 +56,25 @@ class VehicleDataMockService(VehicleDataService):
         """
         Retrieve current vehicle state from mock data.
         
+        Cached state is returned without simulated latency; the network
+        delay only applies when a new scenario state has to be fetched.
+        
         Returns:
             VehicleState object
         
         Raises:
             Exception: If simulated failure occurs
         """
-        self._simulate_delay()
-        
         if self._should_fail():
             raise Exception("Mock failure: Unable to reach vehicle")
         
-        # Return cached state if available, otherwise generate new
+        # Return cached state if available, otherwise generate and cache it
         if self._cached_state:
             return self._cached_state
         
-        return self._get_scenario_state()
+        self._simulate_delay()
+        self._cached_state = self._get_scenario_state()
+        return self._cached_state
     
     def refresh_data(self) -> VehicleState:
         """
@@ -8,10 +8,40 @@ heated seats, heated steering wheel, and defrost settings.
 from dataclasses import dataclass
 from typing import Dict, Any
 
-from models.enums import SeatHeatLevel
+from models.enums import SeatHeatLevel, enum_from_value
 
+# Valid target temperature range in Celsius
+TEMP_MIN_CELSIUS = 15.0
+TEMP_MAX_CELSIUS = 28.0
 
-@dataclass
+# Battery drain (% per 10 min) per seat heat level, looked up instead of branched on
+_FRONT_SEAT_DRAIN = {
+    level: 0.0 if level is SeatHeatLevel.OFF else 0.2 for level in SeatHeatLevel
+}
+# Rear seats draw more power
+_REAR_SEAT_DRAIN = {
+    level: 0.0 if level is SeatHeatLevel.OFF else 0.3 for level in SeatHeatLevel
+}
+
+
+def _check_temperature(temp_celsius: float) -> None:
+    """
+    Raise ValueError if temperature is outside the supported range.
+    
+    Args:
+        temp_celsius: Temperature in Celsius to validate
+        
+    Raises:
+        ValueError: If temperature is outside valid range
+    """
+    if not TEMP_MIN_CELSIUS <= temp_celsius <= TEMP_MAX_CELSIUS:
+        raise ValueError(
+            f"Temperature {temp_celsius}°C out of range "
+            f"({TEMP_MIN_CELSIUS:g}-{TEMP_MAX_CELSIUS:g}°C)"
+        )
+
+
+@dataclass(slots=True)
 class ClimateSettings:
     """
     Complete climate control state for the vehicle.
@@ -43,10 +73,7 @@ class ClimateSettings:
     
     def __post_init__(self) -> None:
         """Validate temperature range after initialization."""
-        if not 15.0 <= self.target_temp_celsius <= 28.0:
-            raise ValueError(
-                f"Temperature {self.target_temp_celsius}°C out of range (15-28°C)"
-            )
+        _check_temperature(self.target_temp_celsius)
     
     def set_temperature(self, temp_celsius: float) -> None:
         """
@@ -58,10 +85,9 @@ class ClimateSettings:
         Raises:
             ValueError: If temperature is outside valid range
         """
-        if not 15.0 <= temp_celsius <= 28.0:
-            raise ValueError(
-                f"Temperature {temp_celsius}°C out of range (15-28°C)"
-            )
+        if temp_celsius == self.target_temp_celsius:
+            return  # Repeated slider value, nothing to change
+        _check_temperature(temp_celsius)
         self.target_temp_celsius = temp_celsius
     
     def estimate_battery_drain_per_10min(self, current_temp_celsius: float) -> float:
@@ -83,25 +109,20 @@ class ClimateSettings:
         temp_diff = abs(self.target_temp_celsius - current_temp_celsius)
         base_drain = min(temp_diff * 0.15, 2.0)  # Max 2% for extreme temps
         
-        # Additional drain from heated seats (0.2% per seat on non-OFF)
-        seat_drain = 0.0
-        if self.front_left_seat_heat != SeatHeatLevel.OFF:
-            seat_drain += 0.2
-        if self.front_right_seat_heat != SeatHeatLevel.OFF:
-            seat_drain += 0.2
-        if self.rear_seat_heat != SeatHeatLevel.OFF:
-            seat_drain += 0.3  # Rear seats draw more power
-        
-        # Additional drain from steering wheel (0.15%)
-        if self.steering_wheel_heat:
-            seat_drain += 0.15
+        # Additional drain from heated seats (0.2% per front seat, 0.3% rear on non-OFF)
+        # and steering wheel (0.15%)
+        seat_drain = (
+            _FRONT_SEAT_DRAIN[self.front_left_seat_heat]
+            + _FRONT_SEAT_DRAIN[self.front_right_seat_heat]
+            + _REAR_SEAT_DRAIN[self.rear_seat_heat]
+            + (0.15 if self.steering_wheel_heat else 0.0)
+        )
         
         # Additional drain from defrost (0.3% per defrost)
-        defrost_drain = 0.0
-        if self.front_defrost:
-            defrost_drain += 0.3
-        if self.rear_defrost:
-            defrost_drain += 0.3
+        defrost_drain = (
+            (0.3 if self.front_defrost else 0.0)
+            + (0.3 if self.rear_defrost else 0.0)
+        )
         
         total_drain = base_drain + seat_drain + defrost_drain
         return round(total_drain, 2)
@@ -139,9 +160,13 @@ class ClimateSettings:
         return cls(
             is_active=data.get('is_active', False),
             target_temp_celsius=data.get('target_temp_celsius', 21.0),
-            front_left_seat_heat=SeatHeatLevel(data.get('front_left_seat_heat', 'off')),
-            front_right_seat_heat=SeatHeatLevel(data.get('front_right_seat_heat', 'off')),
-            rear_seat_heat=SeatHeatLevel(data.get('rear_seat_heat', 'off')),
+            front_left_seat_heat=enum_from_value(
+                SeatHeatLevel, data.get('front_left_seat_heat', 'off')
+            ),
+            front_right_seat_heat=enum_from_value(
+                SeatHeatLevel, data.get('front_right_seat_heat', 'off')
+            ),
+            rear_seat_heat=enum_from_value(SeatHeatLevel, data.get('rear_seat_heat', 'off')),
             steering_wheel_heat=data.get('steering_wheel_heat', False),
             front_defrost=data.get('front_defrost', False),
             rear_defrost=data.get('rear_defrost', False),
@@ -5,6 +5,10 @@ Defines enums per UML class diagram: Home_Screen_Vehicle_Status_v3_class_diagram
 """
 
 from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Type, TypeVar
+
+E = TypeVar('E', bound=Enum)
 
 
 class UnitSystem(Enum):
@@ -54,3 +58,33 @@ class SeatHeatLevel(Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
+
+
+@lru_cache(maxsize=None)
+def _value_map(enum_cls: Type[Enum]) -> Dict[Any, Enum]:
+    """Build (once per enum class) the value -> member lookup."""
+    return {member.value: member for member in enum_cls}
+
+
+def enum_from_value(enum_cls: Type[E], value: Any) -> E:
+    """
+    Resolve a serialized value to its enum member.
+    
+    Known values come from a cached dict; anything else, including
+    unhashable values, falls back to the enum constructor, so unknown
+    values still raise ValueError.
+    
+    Args:
+        enum_cls: Enum class to resolve against
+        value: Serialized enum value
+    
+    Returns:
+        Matching enum member
+    
+    Raises:
+        ValueError: If value is not a member of enum_cls
+    """
+    try:
+        return _value_map(enum_cls)[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
@@ -10,10 +10,10 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import UUID, uuid4
 
-from models.enums import CommandType, CommandStatus
+from models.enums import CommandType, CommandStatus, enum_from_value
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteCommand:
     """
     Remote command for vehicle control.
@@ -104,9 +104,9 @@ class RemoteCommand:
         """
         return cls(
             command_id=UUID(data['command_id']),
-            command_type=CommandType(data['command_type']),
+            command_type=enum_from_value(CommandType, data['command_type']),
             parameters=data.get('parameters', {}),
-            status=CommandStatus(data['status']),
+            status=enum_from_value(CommandStatus, data['status']),
             timestamp=datetime.fromisoformat(data['timestamp']),
             response_time=data.get('response_time'),
             error_message=data.get('error_message')
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class TrunkStatus:
     """
     Status of vehicle storage compartments.
@@ -4,11 +4,11 @@ UserProfile model - represents user preferences.
 Per UML class diagram: Home_Screen_Vehicle_Status_v3_class_diagram.puml
 """
 
-from dataclasses import dataclass, asdict
-from models.enums import UnitSystem, TempUnit
+from dataclasses import dataclass
+from models.enums import UnitSystem, TempUnit, enum_from_value
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """
     User preferences and settings.
@@ -24,18 +24,19 @@ class UserProfile:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        data['unit_system'] = self.unit_system.value
-        data['temp_unit'] = self.temp_unit.value
-        return data
+        return {
+            'user_id': self.user_id,
+            'unit_system': self.unit_system.value,
+            'temp_unit': self.temp_unit.value
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'UserProfile':
         """Create UserProfile from dictionary."""
         return cls(
             user_id=data['user_id'],
-            unit_system=UnitSystem(data['unit_system']),
-            temp_unit=TempUnit(data['temp_unit'])
+            unit_system=enum_from_value(UnitSystem, data['unit_system']),
+            temp_unit=enum_from_value(TempUnit, data['temp_unit'])
         )
     
     @staticmethod
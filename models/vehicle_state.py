@@ -5,15 +5,15 @@ Per UML class diagram: Home_Screen_Vehicle_Status_v3_class_diagram.puml
 Extended for Remote Controls feature (002) with climate and trunk status.
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
-from models.enums import LockStatus
+from models.enums import LockStatus, enum_from_value
 from models.climate_settings import ClimateSettings
 from models.trunk_status import TrunkStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleState:
     """
     Current state of the vehicle.
@@ -45,14 +45,21 @@ class VehicleState:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        data['lock_status'] = self.lock_status.value
-        data['last_updated'] = self.last_updated.isoformat()
-        if self.lock_timestamp:
-            data['lock_timestamp'] = self.lock_timestamp.isoformat()
-        data['climate_settings'] = self.climate_settings.to_dict()
-        data['trunk_status'] = self.trunk_status.to_dict()
-        return data
+        return {
+            'battery_soc': self.battery_soc,
+            'estimated_range_km': self.estimated_range_km,
+            'lock_status': self.lock_status.value,
+            'cabin_temp_celsius': self.cabin_temp_celsius,
+            'climate_on': self.climate_on,
+            'last_updated': self.last_updated.isoformat(),
+            'lock_timestamp': (
+                self.lock_timestamp.isoformat() if self.lock_timestamp else None
+            ),
+            'climate_settings': self.climate_settings.to_dict(),
+            'trunk_status': self.trunk_status.to_dict(),
+            'is_plugged_in': self.is_plugged_in,
+            'speed_mph': self.speed_mph
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'VehicleState':
@@ -60,7 +67,7 @@ class VehicleState:
         return cls(
             battery_soc=data['battery_soc'],
             estimated_range_km=data['estimated_range_km'],
-            lock_status=LockStatus(data['lock_status']),
+            lock_status=enum_from_value(LockStatus, data['lock_status']),
             cabin_temp_celsius=data['cabin_temp_celsius'],
             climate_on=data['climate_on'],
             last_updated=datetime.fromisoformat(data['last_updated']),
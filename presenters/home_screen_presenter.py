@@ -5,6 +5,8 @@ Per UML class diagram: Home_Screen_Vehicle_Status_v3_class_diagram.puml
 Handles data formatting and unit conversions.
 """
 
+from datetime import datetime
+
 from models.vehicle_state import VehicleState
 from models.user_profile import UserProfile
 from models.enums import UnitSystem, TempUnit
@@ -108,11 +110,7 @@ class HomeScreenPresenter:
         Returns:
             Formatted relative time string
         """
-        from datetime import datetime
-        
-        now = datetime.now()
-        diff = now - vehicle_state.last_updated
-        seconds = int(diff.total_seconds())
+        seconds = int((datetime.now() - vehicle_state.last_updated).total_seconds())
         
         if seconds < 60:
             return f"{seconds}s ago"
@@ -6,7 +6,8 @@ Ensures commands are executed one at a time to prevent conflicts
 """
 
 from collections import deque
-from typing import Optional, List
+from itertools import count
+from typing import Optional, List, Dict, Tuple
 from uuid import UUID
 
 from models.remote_command import RemoteCommand
@@ -19,23 +20,41 @@ class CommandQueue:
     Maintains a queue of pending commands and ensures only one command
     executes at a time. Prevents conflicts like simultaneous lock/unlock.
     
-    Thread-safe for single-threaded applications. For multi-threaded use,
-    add locking mechanisms.
+    Backed by collections.deque, whose append/popleft are atomic under the
+    GIL. One producer thread (send_command) and one consumer thread (the
+    execution worker) can therefore share a queue without a lock.
+    
+    A dict index keyed by command ID holds the commands still pending, so
+    find/remove are O(1). Removed commands stay in the deque as tombstones
+    and are skipped when they reach the front in dequeue. Every entry
+    carries a sequence number, stored in both the deque and the index, so
+    a command that is removed and enqueued again is not mistaken for its
+    own tombstone.
     """
     
     def __init__(self) -> None:
         """Initialize empty command queue."""
-        self._queue: deque[RemoteCommand] = deque()
+        self._queue: deque[Tuple[int, RemoteCommand]] = deque()
+        self._index: Dict[UUID, Tuple[int, RemoteCommand]] = {}
+        self._sequence = count()
         self._executing: Optional[RemoteCommand] = None
     
     def enqueue(self, command: RemoteCommand) -> None:
         """
         Add command to the end of the queue.
         
+        Enqueuing a command that is already pending moves it to the end.
+        
         Args:
             command: RemoteCommand to enqueue
         """
-        self._queue.append(command)
+        entry = (next(self._sequence), command)
+        # Re-insert rather than overwrite, so index order stays queue order
+        self._index.pop(command.command_id, None)
+        # Index before appending so a concurrent dequeue never mistakes
+        # the new entry for a tombstone
+        self._index[command.command_id] = entry
+        self._queue.append(entry)
     
     def dequeue(self) -> Optional[RemoteCommand]:
         """
@@ -44,9 +63,18 @@ class CommandQueue:
         Returns:
             Next command in queue, or None if queue is empty
         """
-        if self._queue:
-            return self._queue.popleft()
-        return None
+        # Single popleft rather than check-then-pop, so a concurrent
+        # producer can never observe a half-finished dequeue
+        while True:
+            try:
+                entry = self._queue.popleft()
+            except IndexError:
+                return None
+            command = entry[1]
+            if self._index.get(command.command_id) is entry:
+                del self._index[command.command_id]
+                return command
+            # Tombstone left by remove_by_id or a re-enqueue; skip it
     
     def get_pending(self) -> List[RemoteCommand]:
         """
@@ -57,7 +85,8 @@ class CommandQueue:
         Returns:
             List of pending commands (oldest first)
         """
-        return list(self._queue)
+        # enqueue re-inserts moved commands, so index order is queue order
+        return [command for _, command in self._index.values()]
     
     def set_executing(self, command: Optional[RemoteCommand]) -> None:
         """
@@ -84,7 +113,7 @@ class CommandQueue:
         Returns:
             True if queue is empty (no pending commands)
         """
-        return len(self._queue) == 0
+        return not self._index
     
     def size(self) -> int:
         """
@@ -93,11 +122,12 @@ class CommandQueue:
         Returns:
             Number of commands waiting for execution
         """
-        return len(self._queue)
+        return len(self._index)
     
     def clear(self) -> None:
         """Remove all pending commands from queue."""
         self._queue.clear()
+        self._index.clear()
         self._executing = None
     
     def find_by_id(self, command_id: UUID) -> Optional[RemoteCommand]:
@@ -110,9 +140,9 @@ class CommandQueue:
         Returns:
             Command if found in queue, None otherwise
         """
-        for cmd in self._queue:
-            if cmd.command_id == command_id:
-                return cmd
+        entry = self._index.get(command_id)
+        if entry is not None:
+            return entry[1]
         
         if self._executing and self._executing.command_id == command_id:
             return self._executing
@@ -134,9 +164,5 @@ class CommandQueue:
         if self._executing and self._executing.command_id == command_id:
             return False  # Cannot cancel executing command
         
-        for i, cmd in enumerate(self._queue):
-            if cmd.command_id == command_id:
-                del self._queue[i]
-                return True
-        
-        return False
+        # Leave the deque entry in place; dequeue skips it once unindexed
+        return self._index.pop(command_id, None) is not None
@@ -10,18 +10,30 @@ import sys
 from typing import Any, Optional
 from contextlib import contextmanager
 
+# Append-only command history log (JSON Lines)
+COMMAND_HISTORY_FILE = 'data/command_history.jsonl'
+
+# Optional fast JSON backend (falls back to stdlib json when unavailable)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
 # Platform-specific file locking
 if sys.platform == 'win32':
     import msvcrt
     
     @contextmanager
-    def file_lock(file_path: str, mode: str = 'r'):
+    def file_lock(file_path: str, mode: str = 'r', shared: bool = False):
         """
         Context manager for file locking (Windows).
         
+        msvcrt has no shared locks, so readers also lock exclusively.
+        
         Args:
             file_path: Path to file to lock
             mode: File open mode ('r' or 'w')
+            shared: Ignored on Windows
         
         Yields:
             File handle with exclusive lock
@@ -36,25 +48,61 @@ else:
     import fcntl
     
     @contextmanager
-    def file_lock(file_path: str, mode: str = 'r'):
+    def file_lock(file_path: str, mode: str = 'r', shared: bool = False):
         """
         Context manager for file locking (Unix).
         
         Args:
             file_path: Path to file to lock
             mode: File open mode ('r' or 'w')
+            shared: Take a shared (reader) lock instead of an exclusive one
         
         Yields:
-            File handle with exclusive lock
+            File handle with shared or exclusive lock
         """
         with open(file_path, mode) as f:
             try:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
                 yield f
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
 
+def _dumps(data: Any) -> bytes:
+    """
+    Serialize data to indented JSON bytes.
+    
+    Uses orjson when installed, stdlib json otherwise.
+    
+    Args:
+        data: Data to serialize
+    
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """
+    Parse JSON bytes.
+    
+    Uses orjson when installed, stdlib json otherwise. Both raise a
+    json.JSONDecodeError subclass on malformed input.
+    
+    Args:
+        raw: UTF-8 encoded JSON document
+    
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def safe_read_json(file_path: str, default: Any = None) -> Optional[Any]:
     """
     Safely read JSON file with file locking.
@@ -66,13 +114,11 @@ def safe_read_json(file_path: str, default: Any = None) -> Optional[Any]:
     Returns:
         Parsed JSON data or default value
     """
-    if not os.path.exists(file_path):
-        return default
-    
+    # A missing file surfaces as FileNotFoundError (an IOError) from open
     try:
-        with file_lock(file_path, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        with file_lock(file_path, 'rb', shared=True) as f:
+            return _loads(f.read())
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError):
         return default
 
 
@@ -86,26 +132,42 @@ def atomic_write_json(file_path: str, data: Any) -> bool:
         file_path: Path to JSON file
         data: Data to serialize to JSON
     
+    Returns:
+        True if successful, False otherwise
+    """
+    return _atomic_write_bytes(file_path, _dumps(data))
+
+
+def _atomic_write_bytes(file_path: str, payload: bytes) -> bool:
+    """
+    Atomically replace file contents with payload.
+    
+    Args:
+        file_path: Path to file
+        payload: Complete new file contents
+    
     Returns:
         True if successful, False otherwise
     """
     temp_path = f"{file_path}.tmp"
     
     try:
-        # Write to temporary file
-        with open(temp_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write to temporary file and flush it to disk, so the rename
+        # can never expose a file whose data has not been persisted yet
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
         
         # Atomic rename
         os.replace(temp_path, file_path)
         return True
     except (IOError, OSError):
-        # Clean up temp file on failure
-        if os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
+        # Clean up temp file on failure (it may never have been created)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
         return False
 
 
@@ -117,35 +179,146 @@ def ensure_directory(file_path: str) -> None:
         file_path: Path to file (directory will be created)
     """
     directory = os.path.dirname(file_path)
-    if directory and not os.path.exists(directory):
+    if directory:
         os.makedirs(directory, exist_ok=True)
 
 
-def save_command_history(commands: list, file_path: str = 'data/command_history.json') -> bool:
+def _to_dict_default(obj: Any) -> Any:
+    """
+    Serialize model objects through their to_dict for stdlib json.
+    
+    Args:
+        obj: Object json.dumps could not serialize
+    
+    Returns:
+        Dictionary representation of obj
+    
+    Raises:
+        TypeError: If obj has no to_dict method
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _dumps_line(data: Any) -> bytes:
+    """
+    Serialize data to a single newline-terminated JSON line.
+    
+    Dataclass models are accepted directly: orjson serializes them natively
+    (UUIDs, enums and naive datetimes come out exactly as in to_dict), and
+    the stdlib fallback goes through to_dict.
+    
+    Args:
+        data: Data to serialize
+    
+    Returns:
+        UTF-8 encoded JSON line
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, default=_to_dict_default).encode('utf-8') + b'\n'
+
+
+def save_command_history(commands: list, file_path: str = COMMAND_HISTORY_FILE) -> bool:
+    """
+    Rewrite the command history log with exactly the given commands.
+    
+    Used by RemoteCommandMockService to compact the append-only log.
+    
+    Args:
+        commands: List of RemoteCommand objects or command dictionaries
+        file_path: Path to history file (JSON Lines)
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    ensure_directory(file_path)
+    return _atomic_write_bytes(file_path, b''.join(_dumps_line(c) for c in commands))
+
+
+def append_command_history(commands: list, file_path: str = COMMAND_HISTORY_FILE) -> bool:
     """
-    Save command history to JSON file.
+    Append commands to the history log, one JSON object per line.
     
-    Used by RemoteCommandMockService to persist command history.
+    Cost is proportional to the number of new commands, not to the size
+    of the history already on disk.
     
     Args:
-        commands: List of command dictionaries
-        file_path: Path to history file
+        commands: List of RemoteCommand objects or command dictionaries to append
+        file_path: Path to history file (JSON Lines)
     
     Returns:
         True if successful, False otherwise
     """
     ensure_directory(file_path)
-    return atomic_write_json(file_path, commands)
+    try:
+        with open(file_path, 'ab') as f:
+            f.write(b''.join(_dumps_line(c) for c in commands))
+        return True
+    except (IOError, OSError):
+        return False
 
 
-def load_command_history(file_path: str = 'data/command_history.json') -> list:
+def load_command_history(file_path: str = COMMAND_HISTORY_FILE) -> list:
     """
-    Load command history from JSON file.
+    Load command history from the JSON Lines log.
+    
+    Malformed lines (e.g. a write torn by a crash) are skipped.
     
     Args:
-        file_path: Path to history file
+        file_path: Path to history file (JSON Lines)
     
     Returns:
-        List of command dictionaries, or empty list if file doesn't exist
+        List of command dictionaries in log order, or empty list if the
+        file doesn't exist
     """
-    return safe_read_json(file_path, default=[])
+    commands = []
+    try:
+        with file_lock(file_path, 'rb', shared=True) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    commands.append(_loads(line))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+    except FileNotFoundError:
+        # No log yet; pick up history saved in the old JSON array format
+        if _migrate_legacy_history(file_path):
+            return load_command_history(file_path)
+        return []
+    except (IOError, OSError):
+        return []
+    return commands
+
+
+def _migrate_legacy_history(file_path: str) -> bool:
+    """
+    Convert a legacy JSON array history file into the JSON Lines log.
+    
+    Command history used to be saved as one JSON array next to the log
+    (command_history.json for command_history.jsonl). Its entries are
+    written to the log and the legacy file is removed, so this runs once.
+    
+    Args:
+        file_path: Path to history file (JSON Lines)
+    
+    Returns:
+        True if legacy history was migrated, False otherwise
+    """
+    root, ext = os.path.splitext(file_path)
+    if ext != '.jsonl':
+        return False
+    legacy_path = f"{root}.json"
+    
+    legacy = safe_read_json(legacy_path)
+    if not isinstance(legacy, list) or not save_command_history(legacy, file_path):
+        return False
+    
+    try:
+        os.remove(legacy_path)
+    except OSError:
+        pass
+    return True
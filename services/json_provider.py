@@ -0,0 +1,61 @@
+"""
+Flask JSON provider backed by orjson.
+
+Serializes API responses with orjson when it is installed and falls back to
+Flask's stdlib-based provider otherwise, so response bodies stay compatible.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+# Share data_persistence's optional backend (None when orjson is not installed)
+from services.data_persistence import orjson
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that uses orjson for compact dumps and plain loads.
+    
+    Datetimes and dataclasses are passed through to Flask's default
+    handler so they serialize exactly as with DefaultJSONProvider.
+    Indented (debug) output and custom keyword arguments use the stdlib path.
+    """
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON to a string.
+        
+        Args:
+            obj: The data to serialize
+            **kwargs: Passed to json.dumps on the stdlib path
+        
+        Returns:
+            JSON string
+        """
+        if orjson is None or kwargs.keys() - {'separators'}:
+            return super().dumps(obj, **kwargs)
+        
+        option = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """
+        Deserialize data as JSON from a string or bytes.
+        
+        Args:
+            s: Text or UTF-8 bytes
+            **kwargs: Passed to json.loads on the stdlib path
+        
+        Returns:
+            Deserialized Python object
+        """
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -6,7 +6,7 @@ Mock implementations provide realistic behavior for development and testing.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from models.remote_command import RemoteCommand
@@ -41,6 +41,26 @@ class RemoteCommandService(ABC):
         """
         pass
     
+    def send_commands(self, commands: List[RemoteCommand]) -> List[RemoteCommand]:
+        """
+        Send several commands to the vehicle in one request.
+        
+        Commands execute in list order. The default implementation sends
+        them one at a time; backends that can batch (one HTTP request, one
+        BLE frame) should override it.
+        
+        Args:
+            commands: RemoteCommands to execute, in order
+            
+        Returns:
+            The commands with updated status, in the same order
+            
+        Raises:
+            ValueError: If a command is invalid or vehicle state prevents execution
+            ConnectionError: If unable to reach vehicle
+        """
+        return [self.send_command(command) for command in commands]
+    
     @abstractmethod
     def get_command_status(self, command_id: UUID) -> Optional[RemoteCommand]:
         """
@@ -54,6 +74,25 @@ class RemoteCommandService(ABC):
         """
         pass
     
+    def get_command_statuses(
+        self, command_ids: Iterable[UUID]
+    ) -> Dict[UUID, RemoteCommand]:
+        """
+        Query the status of several previously sent commands.
+        
+        Args:
+            command_ids: Unique identifiers of commands to check
+            
+        Returns:
+            Mapping of command ID to RemoteCommand; unknown IDs are omitted
+        """
+        statuses = {}
+        for command_id in command_ids:
+            command = self.get_command_status(command_id)
+            if command is not None:
+                statuses[command_id] = command
+        return statuses
+    
     @abstractmethod
     def cancel_command(self, command_id: UUID) -> bool:
         """
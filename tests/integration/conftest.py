@@ -0,0 +1,25 @@
+"""
+Shared fixtures for API integration tests.
+"""
+
+import pytest
+
+import app as app_module
+from app import app
+
+
+@pytest.fixture(scope='session')
+def client():
+    """Create one Flask test client shared by the whole test session."""
+    app.config['TESTING'] = True
+    
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def reset_remote_command_service():
+    """Reset remote_command_service so each test starts from a clean state."""
+    app_module.remote_command_service = None
+    yield
+    app_module.remote_command_service = None
@@ -5,50 +5,48 @@ Tests heated seats, heated steering wheel, and defrost controls.
 """
 
 import pytest
-from app import app
+from dataclasses import replace
+from datetime import datetime
+from app import get_remote_command_service
 from models import VehicleState
 from models.climate_settings import ClimateSettings
-from models.enums import SeatHeatLevel, LockStatus
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the Flask app."""
-    app.config['TESTING'] = True
-    
-    # Reset remote_command_service to ensure clean state
-    import app as app_module
-    app_module.remote_command_service = None
-    
-    with app.test_client() as client:
-        yield client
+from models.remote_command import RemoteCommand
+from models.enums import CommandType, CommandStatus, SeatHeatLevel, LockStatus
 
 
 @pytest.fixture
 def vehicle_state():
-    """Create a default vehicle state for testing."""
-    from datetime import datetime
+    """Create a vehicle state with climate control running."""
     return VehicleState(
         battery_soc=80.0,
         estimated_range_km=250.0,
         lock_status=LockStatus.LOCKED,
         cabin_temp_celsius=20.0,
-        climate_on=False,
+        climate_on=True,
+        climate_settings=ClimateSettings(
+            is_active=True,
+            target_temp_celsius=21.0,
+            is_plugged_in=True
+        ),
         last_updated=datetime.now(),
         is_plugged_in=True
     )
 
 
-def test_set_seat_heat_driver(client, vehicle_state):
-    """Test setting driver seat heat level."""
-    from app import get_remote_command_service
-    
+@pytest.mark.parametrize('seat,level', [
+    ('front_left', 'high'),
+    ('front_right', 'medium'),
+    ('rear', 'low'),
+    ('front_left', 'off'),
+])
+def test_set_seat_heat(client, vehicle_state, seat, level):
+    """Test setting seat heat level for each seat."""
     service = get_remote_command_service()
     service.vehicle_state = vehicle_state
     
     response = client.post('/api/vehicle/seat-heat', json={
-        'seat': 'front_left',
-        'level': 'high'
+        'seat': seat,
+        'level': level
     })
     
     assert response.status_code == 200
@@ -57,61 +55,8 @@ def test_set_seat_heat_driver(client, vehicle_state):
     assert 'command_id' in data
 
 
-def test_set_seat_heat_passenger(client, vehicle_state):
-    """Test setting passenger seat heat level."""
-    from app import get_remote_command_service
-    
-    service = get_remote_command_service()
-    service.vehicle_state = vehicle_state
-    
-    response = client.post('/api/vehicle/seat-heat', json={
-        'seat': 'front_right',
-        'level': 'medium'
-    })
-    
-    assert response.status_code == 200
-    data = response.get_json()
-    assert data['success'] is True
-
-
-def test_set_seat_heat_rear(client, vehicle_state):
-    """Test setting rear seat heat level."""
-    from app import get_remote_command_service
-    
-    service = get_remote_command_service()
-    service.vehicle_state = vehicle_state
-    
-    response = client.post('/api/vehicle/seat-heat', json={
-        'seat': 'rear',
-        'level': 'low'
-    })
-    
-    assert response.status_code == 200
-    data = response.get_json()
-    assert data['success'] is True
-
-
-def test_set_seat_heat_off(client, vehicle_state):
-    """Test turning off seat heat."""
-    from app import get_remote_command_service
-    
-    service = get_remote_command_service()
-    service.vehicle_state = vehicle_state
-    
-    response = client.post('/api/vehicle/seat-heat', json={
-        'seat': 'front_left',
-        'level': 'off'
-    })
-    
-    assert response.status_code == 200
-    data = response.get_json()
-    assert data['success'] is True
-
-
 def test_set_seat_heat_invalid_seat(client, vehicle_state):
     """Test invalid seat position."""
-    from app import get_remote_command_service
-    
     service = get_remote_command_service()
     service.vehicle_state = vehicle_state
     
@@ -128,8 +73,6 @@ def test_set_seat_heat_invalid_seat(client, vehicle_state):
 
 def test_set_seat_heat_invalid_level(client, vehicle_state):
     """Test invalid heat level."""
-    from app import get_remote_command_service
-    
     service = get_remote_command_service()
     service.vehicle_state = vehicle_state
     
@@ -144,15 +87,14 @@ def test_set_seat_heat_invalid_level(client, vehicle_state):
     assert 'Invalid heat level' in data['error']
 
 
-def test_steering_heat_on(client, vehicle_state):
-    """Test turning on heated steering wheel."""
-    from app import get_remote_command_service
-    
+@pytest.mark.parametrize('enabled', [True, False])
+def test_steering_heat(client, vehicle_state, enabled):
+    """Test turning heated steering wheel on and off."""
     service = get_remote_command_service()
     service.vehicle_state = vehicle_state
     
     response = client.post('/api/vehicle/steering-heat', json={
-        'enabled': True
+        'enabled': enabled
     })
     
     assert response.status_code == 200
@@ -161,32 +103,20 @@ def test_steering_heat_on(client, vehicle_state):
     assert 'command_id' in data
 
 
-def test_steering_heat_off(client, vehicle_state):
-    """Test turning off heated steering wheel."""
-    from app import get_remote_command_service
-    
-    service = get_remote_command_service()
-    service.vehicle_state = vehicle_state
-    
-    response = client.post('/api/vehicle/steering-heat', json={
-        'enabled': False
-    })
-    
-    assert response.status_code == 200
-    data = response.get_json()
-    assert data['success'] is True
-
-
-def test_front_defrost_on(client, vehicle_state):
-    """Test turning on front defrost."""
-    from app import get_remote_command_service
-    
+@pytest.mark.parametrize('position,enabled', [
+    ('front', True),
+    ('front', False),
+    ('rear', True),
+    ('rear', False),
+])
+def test_defrost(client, vehicle_state, position, enabled):
+    """Test turning front and rear defrost on and off."""
     service = get_remote_command_service()
     service.vehicle_state = vehicle_state
     
     response = client.post('/api/vehicle/defrost', json={
-        'position': 'front',
-        'enabled': True
+        'position': position,
+        'enabled': enabled
     })
     
     assert response.status_code == 200
@@ -195,61 +125,8 @@ def test_front_defrost_on(client, vehicle_state):
     assert 'command_id' in data
 
 
-def test_front_defrost_off(client, vehicle_state):
-    """Test turning off front defrost."""
-    from app import get_remote_command_service
-    
-    service = get_remote_command_service()
-    service.vehicle_state = vehicle_state
-    
-    response = client.post('/api/vehicle/defrost', json={
-        'position': 'front',
-        'enabled': False
-    })
-    
-    assert response.status_code == 200
-    data = response.get_json()
-    assert data['success'] is True
-
-
-def test_rear_defrost_on(client, vehicle_state):
-    """Test turning on rear defrost."""
-    from app import get_remote_command_service
-    
-    service = get_remote_command_service()
-    service.vehicle_state = vehicle_state
-    
-    response = client.post('/api/vehicle/defrost', json={
-        'position': 'rear',
-        'enabled': True
-    })
-    
-    assert response.status_code == 200
-    data = response.get_json()
-    assert data['success'] is True
-
-
-def test_rear_defrost_off(client, vehicle_state):
-    """Test turning off rear defrost."""
-    from app import get_remote_command_service
-    
-    service = get_remote_command_service()
-    service.vehicle_state = vehicle_state
-    
-    response = client.post('/api/vehicle/defrost', json={
-        'position': 'rear',
-        'enabled': False
-    })
-    
-    assert response.status_code == 200
-    data = response.get_json()
-    assert data['success'] is True
-
-
 def test_defrost_invalid_position(client, vehicle_state):
     """Test invalid defrost position."""
-    from app import get_remote_command_service
-    
     service = get_remote_command_service()
     service.vehicle_state = vehicle_state
     
@@ -266,47 +143,55 @@ def test_defrost_invalid_position(client, vehicle_state):
 
 def test_full_advanced_climate_sequence(client, vehicle_state):
     """Test complete sequence of advanced climate features."""
-    from app import get_remote_command_service
-    
     service = get_remote_command_service()
-    service.vehicle_state = vehicle_state
+    service.vehicle_state = replace(vehicle_state, climate_on=False)
+    # Skip the simulated latency; the autouse fixture discards this service
+    service.min_delay_ms = service.max_delay_ms = 0
     
-    # Set driver seat to high
-    response = client.post('/api/vehicle/seat-heat', json={
-        'seat': 'front_left',
-        'level': 'high'
+    # Start climate and set driver seat heat through the API
+    response = client.post('/api/vehicle/climate', json={
+        'action': 'start',
+        'temperature': 22.0
     })
     assert response.status_code == 200
     
-    # Set passenger seat to medium
     response = client.post('/api/vehicle/seat-heat', json={
-        'seat': 'front_right',
-        'level': 'medium'
-    })
-    assert response.status_code == 200
-    
-    # Turn on steering heat
-    response = client.post('/api/vehicle/steering-heat', json={
-        'enabled': True
-    })
-    assert response.status_code == 200
-    
-    # Turn on front defrost
-    response = client.post('/api/vehicle/defrost', json={
-        'position': 'front',
-        'enabled': True
+        'seat': 'front_left',
+        'level': 'high'
     })
     assert response.status_code == 200
+    command_id = response.get_json()['command_id']
     
-    # Turn on rear defrost
-    response = client.post('/api/vehicle/defrost', json={
-        'position': 'rear',
-        'enabled': True
-    })
+    # Read the command status back
+    response = client.get(f'/api/vehicle/commands/{command_id}')
     assert response.status_code == 200
+    assert response.get_json()['data']['status'] == 'success'
+    
+    # Each endpoint is covered above; send the remaining features in one batch
+    results = service.send_commands([
+        RemoteCommand(
+            command_type=CommandType.SEAT_HEAT,
+            parameters={'seat': 'front_right', 'level': 'medium'}
+        ),
+        RemoteCommand(
+            command_type=CommandType.STEERING_HEAT,
+            parameters={'enabled': True}
+        ),
+        RemoteCommand(
+            command_type=CommandType.DEFROST,
+            parameters={'position': 'front', 'enabled': True}
+        ),
+        RemoteCommand(
+            command_type=CommandType.DEFROST,
+            parameters={'position': 'rear', 'enabled': True}
+        ),
+    ])
+    assert all(cmd.status == CommandStatus.SUCCESS for cmd in results)
     
     # Verify state
     climate = service.vehicle_state.climate_settings
+    assert service.vehicle_state.climate_on is True
+    assert climate.target_temp_celsius == 22.0
     assert climate.front_left_seat_heat == SeatHeatLevel.HIGH
     assert climate.front_right_seat_heat == SeatHeatLevel.MEDIUM
     assert climate.steering_wheel_heat is True
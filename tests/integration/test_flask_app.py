@@ -37,7 +37,7 @@ def test_get_vehicle_status(client):
     response = client.get('/api/vehicle/status')
     assert response.status_code == 200
     
-    data = json.loads(response.data)
+    data = response.get_json()
     assert 'success' in data
     assert 'data' in data
     
@@ -52,7 +52,7 @@ def test_refresh_vehicle_status(client):
     response = client.post('/api/vehicle/refresh')
     assert response.status_code in [200, 503]
     
-    data = json.loads(response.data)
+    data = response.get_json()
     assert 'success' in data
 
 
@@ -61,7 +61,7 @@ def test_get_user_profile(client):
     response = client.get('/api/user/profile')
     assert response.status_code == 200
     
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data['success'] is True
     assert 'data' in data
     assert 'unit_system' in data['data']
@@ -83,7 +83,7 @@ def test_update_user_profile(client):
     )
     
     assert response.status_code in [200, 400, 500]
-    data = json.loads(response.data)
+    data = response.get_json()
     assert 'success' in data
 
 
@@ -102,5 +102,5 @@ def test_api_error_handling(client):
     )
     
     assert response.status_code == 400
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data['success'] is False
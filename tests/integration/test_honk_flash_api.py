@@ -7,32 +7,17 @@ Tests Phase 5 (Trunk & Locate) locate vehicle functionality:
 """
 
 import pytest
-from app import app
 from models.enums import LockStatus
 from datetime import datetime
-
-
-@pytest.fixture
-def client():
-    """Flask test client."""
-    app.config['TESTING'] = True
-    
-    # Reset remote_command_service to ensure clean state
-    import app as app_module
-    app_module.remote_command_service = None
-    
-    with app.test_client() as client:
-        yield client
+from app import get_remote_command_service
+from models.vehicle_state import VehicleState
+from models.climate_settings import ClimateSettings
+from models.trunk_status import TrunkStatus
 
 
 @pytest.fixture
 def vehicle_state(monkeypatch):
     """Mock vehicle state."""
-    from app import get_remote_command_service
-    from models.vehicle_state import VehicleState
-    from models.climate_settings import ClimateSettings
-    from models.trunk_status import TrunkStatus
-    
     # Get the mock service instance
     service = get_remote_command_service()
     
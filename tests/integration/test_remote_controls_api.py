@@ -5,30 +5,13 @@ Tests lock/unlock commands and command status polling.
 """
 
 import pytest
-import json
 from datetime import datetime
 
-from app import app
+import app as app_module
 from models.vehicle_state import VehicleState
 from models.enums import LockStatus
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    app.config['TESTING'] = True
-    
-    # Reset remote command service between tests
-    import app as app_module
-    app_module.remote_command_service = None
-    
-    with app.test_client() as client:
-        yield client
-    
-    # Clean up after test
-    app_module.remote_command_service = None
-
-
 @pytest.fixture
 def mock_vehicle_state(monkeypatch):
     """Mock vehicle state for testing."""
@@ -42,9 +25,8 @@ def mock_vehicle_state(monkeypatch):
         speed_mph=0.0
     )
     
-    # Monkey patch get_cached_vehicle_state to return our test state
-    import app as app_module
-    monkeypatch.setattr(app_module, 'get_cached_vehicle_state', lambda: state)
+    # Monkey patch the shared state the command service is rebuilt on
+    monkeypatch.setattr(app_module, 'shared_vehicle_state', state)
     
     return state
 
@@ -65,7 +47,7 @@ class TestRemoteControlsRoutes:
         response = client.post('/api/vehicle/lock')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert 'command_id' in data
         assert data['status'] in ['pending', 'success']
@@ -78,7 +60,7 @@ class TestRemoteControlsRoutes:
         response = client.post('/api/vehicle/unlock')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert 'command_id' in data
         assert data['status'] in ['pending', 'success']
@@ -90,7 +72,7 @@ class TestRemoteControlsRoutes:
         response = client.post('/api/vehicle/lock')
         
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
         assert 'already locked' in data['error'].lower()
     
@@ -101,7 +83,7 @@ class TestRemoteControlsRoutes:
         response = client.post('/api/vehicle/unlock')
         
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
         assert 'already unlocked' in data['error'].lower()
     
@@ -109,14 +91,14 @@ class TestRemoteControlsRoutes:
         """Test GET /api/vehicle/commands/:id returns command status."""
         # First send a command to get a command ID
         lock_response = client.post('/api/vehicle/lock')
-        lock_data = json.loads(lock_response.data)
+        lock_data = lock_response.get_json()
         command_id = lock_data['command_id']
         
         # Query command status
         response = client.get(f'/api/vehicle/commands/{command_id}')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert 'data' in data
         assert data['data']['command_id'] == command_id
@@ -128,7 +110,7 @@ class TestRemoteControlsRoutes:
         response = client.get(f'/api/vehicle/commands/{fake_uuid}')
         
         assert response.status_code == 404
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
         assert 'not found' in data['error'].lower()
     
@@ -137,7 +119,7 @@ class TestRemoteControlsRoutes:
         response = client.get('/api/vehicle/commands/invalid-uuid')
         
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
         assert 'invalid' in data['error'].lower()
     
@@ -0,0 +1,62 @@
+"""
+Unit tests for the vehicle state cache in app.py.
+
+Tests that the in-memory snapshot only tracks states that reached disk.
+"""
+
+from datetime import datetime
+
+import app as app_module
+from models import VehicleState
+from models.enums import LockStatus
+
+
+def make_state() -> VehicleState:
+    """Create a vehicle state for cache tests."""
+    return VehicleState(
+        battery_soc=80.0,
+        estimated_range_km=250.0,
+        lock_status=LockStatus.LOCKED,
+        cabin_temp_celsius=20.0,
+        climate_on=False,
+        last_updated=datetime(2024, 1, 1, 12, 0, 0)
+    )
+
+
+def test_cache_skips_unchanged_state(tmp_path, monkeypatch):
+    """Test re-caching an unchanged state does not rewrite the file."""
+    monkeypatch.setattr(app_module, 'VEHICLE_STATE_FILE', str(tmp_path / 'vehicle_state.json'))
+    monkeypatch.setattr(app_module, '_vehicle_state_snapshot', None)
+    writes = []
+    monkeypatch.setattr(
+        app_module, 'atomic_write_json',
+        lambda path, data: writes.append(data) or True
+    )
+    state = make_state()
+    
+    assert app_module.cache_vehicle_state(state) is True
+    assert app_module.cache_vehicle_state(state) is True
+    
+    assert len(writes) == 1
+
+
+def test_cache_retries_state_after_failed_write(tmp_path, monkeypatch):
+    """Test a failed write is retried for the same state."""
+    monkeypatch.setattr(app_module, 'VEHICLE_STATE_FILE', str(tmp_path / 'vehicle_state.json'))
+    monkeypatch.setattr(app_module, '_vehicle_state_snapshot', None)
+    results = [False, True]
+    writes = []
+    
+    def flaky_write(path, data):
+        writes.append(data)
+        return results.pop(0)
+    
+    monkeypatch.setattr(app_module, 'atomic_write_json', flaky_write)
+    state = make_state()
+    
+    assert app_module.cache_vehicle_state(state) is False
+    assert app_module._vehicle_state_snapshot is None
+    assert app_module.cache_vehicle_state(state) is True
+    
+    assert len(writes) == 2
+    assert app_module._vehicle_state_snapshot == state.to_dict()
@@ -5,6 +5,7 @@ Tests temperature validation, battery drain calculation, and serialization.
 """
 
 import pytest
+from models import climate_settings
 from models.climate_settings import ClimateSettings
 from models.enums import SeatHeatLevel
 
@@ -63,7 +64,22 @@ class TestClimateSettings:
         
         with pytest.raises(ValueError, match="out of range"):
             settings.set_temperature(30.0)
-    
+
+    def test_set_temperature_unchanged_value(self, monkeypatch):
+        """Test setting the current temperature again skips validation."""
+        settings = ClimateSettings(target_temp_celsius=22.0)
+        checked = []
+        monkeypatch.setattr(climate_settings, '_check_temperature', checked.append)
+        
+        settings.set_temperature(22.0)
+        
+        assert checked == []
+        assert settings.target_temp_celsius == 22.0
+        
+        settings.set_temperature(23.0)
+        
+        assert checked == [23.0]
+
     def test_battery_drain_inactive_climate(self):
         """Test no battery drain when climate is off."""
         settings = ClimateSettings(is_active=False)
@@ -15,6 +15,12 @@ from models.enums import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_history(tmp_path, monkeypatch):
+    """Run each test from tmp_path so command history never lands in data/."""
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture
 def vehicle_state():
     """Create test vehicle state."""
@@ -266,6 +272,44 @@ class TestRemoteCommandMockService:
         assert mock_service.get_command_status(cmd2.command_id).status == CommandStatus.SUCCESS
         assert mock_service.get_command_status(cmd3.command_id).status == CommandStatus.SUCCESS
     
+    def test_send_commands_batch(self, mock_service, vehicle_state):
+        """Test a batch of commands executes in order."""
+        cmd1 = RemoteCommand(command_type=CommandType.LOCK)
+        cmd2 = RemoteCommand(command_type=CommandType.HONK_FLASH)
+        
+        results = mock_service.send_commands([cmd1, cmd2])
+        
+        assert results == [cmd1, cmd2]
+        assert vehicle_state.lock_status == LockStatus.LOCKED
+        statuses = mock_service.get_command_statuses([cmd1.command_id, cmd2.command_id])
+        assert {cmd.status for cmd in statuses.values()} == {CommandStatus.SUCCESS}
+    
+    def test_send_commands_validates_against_earlier_commands(self, mock_service, vehicle_state):
+        """Test batch commands that are valid in order are accepted."""
+        commands = [
+            RemoteCommand(command_type=CommandType.LOCK),
+            RemoteCommand(command_type=CommandType.UNLOCK),
+            RemoteCommand(command_type=CommandType.CLIMATE_ON),
+            RemoteCommand(command_type=CommandType.CLIMATE_OFF),
+        ]
+        
+        mock_service.send_commands(commands)
+        
+        assert [cmd.status for cmd in commands] == [CommandStatus.SUCCESS] * 4
+        assert vehicle_state.lock_status == LockStatus.UNLOCKED
+        assert vehicle_state.climate_on is False
+    
+    def test_send_commands_rejects_invalid_batch(self, mock_service, vehicle_state):
+        """Test an invalid command rejects the whole batch."""
+        cmd1 = RemoteCommand(command_type=CommandType.LOCK)
+        cmd2 = RemoteCommand(command_type=CommandType.LOCK)  # Locked by cmd1
+        
+        with pytest.raises(ValueError):
+            mock_service.send_commands([cmd1, cmd2])
+        
+        assert vehicle_state.lock_status == LockStatus.UNLOCKED
+        assert mock_service.get_command_statuses([cmd1.command_id]) == {}
+    
     def test_cancel_pending_command(self, mock_service):
         """Test cancelling a pending command."""
         # Create service with longer delays so command stays pending
@@ -283,3 +327,151 @@ class TestRemoteCommandMockService:
         from uuid import uuid4
         result = service.cancel_command(uuid4())
         assert result is False  # Unknown command ID
+    
+    def test_history_limit_evicts_oldest(self, vehicle_state):
+        """Test history is bounded and evicted commands are forgotten."""
+        service = RemoteCommandMockService(
+            vehicle_state=vehicle_state,
+            success_rate=1.0,
+            min_delay_ms=10,
+            max_delay_ms=20,
+            history_limit=2
+        )
+        
+        cmd1 = RemoteCommand(command_type=CommandType.LOCK)
+        cmd2 = RemoteCommand(command_type=CommandType.UNLOCK)
+        cmd3 = RemoteCommand(command_type=CommandType.HONK_FLASH)
+        service.send_command(cmd1)
+        service.send_command(cmd2)
+        service.send_command(cmd3)
+        
+        assert service.get_command_status(cmd1.command_id) is None
+        assert service.get_command_status(cmd2.command_id) is not None
+        assert service.get_command_status(cmd3.command_id) is not None
+    
+    def test_history_limit_must_be_positive(self, vehicle_state):
+        """Test a history_limit below 1 is rejected."""
+        with pytest.raises(ValueError, match="history_limit"):
+            RemoteCommandMockService(vehicle_state=vehicle_state, history_limit=0)
+    
+    def test_history_persisted_and_reloaded(self, vehicle_state, tmp_path):
+        """Test completed commands are appended to the log and reloaded."""
+        service = RemoteCommandMockService(
+            vehicle_state=vehicle_state,
+            success_rate=1.0,
+            min_delay_ms=10,
+            max_delay_ms=20
+        )
+        cmd1 = RemoteCommand(command_type=CommandType.LOCK)
+        cmd2 = RemoteCommand(command_type=CommandType.UNLOCK)
+        service.send_command(cmd1)
+        service.send_command(cmd2)
+        
+        log_lines = (tmp_path / 'data' / 'command_history.jsonl').read_text().splitlines()
+        assert len(log_lines) == 2
+        
+        reloaded = RemoteCommandMockService(vehicle_state=vehicle_state)
+        assert reloaded.get_command_status(cmd1.command_id).status == CommandStatus.SUCCESS
+        assert reloaded.get_command_status(cmd2.command_id).status == CommandStatus.SUCCESS
+    
+    def test_history_log_compacted(self, vehicle_state, tmp_path):
+        """Test the history log is rewritten once it outgrows the limit."""
+        service = RemoteCommandMockService(
+            vehicle_state=vehicle_state,
+            success_rate=1.0,
+            min_delay_ms=10,
+            max_delay_ms=20,
+            history_limit=2
+        )
+        for _ in range(5):
+            service.send_command(RemoteCommand(command_type=CommandType.HONK_FLASH))
+        
+        log_lines = (tmp_path / 'data' / 'command_history.jsonl').read_text().splitlines()
+        assert len(log_lines) <= 4
+    
+    def test_concurrent_senders_complete_synchronously(self, mock_service):
+        """Test commands from several threads each finish before send returns."""
+        import threading
+        
+        statuses = []
+        
+        def send():
+            cmd = RemoteCommand(command_type=CommandType.HONK_FLASH)
+            mock_service.send_command(cmd)
+            statuses.append(cmd.status)
+        
+        threads = [threading.Thread(target=send) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert statuses == [CommandStatus.SUCCESS] * 4
+    
+    def test_concurrent_senders_validate_against_each_other(self, mock_service, vehicle_state):
+        """Test two threads locking an unlocked vehicle: only one succeeds."""
+        import threading
+        
+        statuses = []
+        errors = []
+        
+        def send():
+            cmd = RemoteCommand(command_type=CommandType.LOCK)
+            try:
+                mock_service.send_command(cmd)
+                statuses.append(cmd.status)
+            except ValueError as e:
+                errors.append(str(e))
+        
+        threads = [threading.Thread(target=send) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert statuses == [CommandStatus.SUCCESS]
+        assert errors == ["Vehicle is already locked"]
+        assert vehicle_state.lock_status == LockStatus.LOCKED
+    
+    def test_load_history_skips_invalid_entries(self, vehicle_state, tmp_path):
+        """Test malformed history entries are skipped on load."""
+        import json
+        
+        valid = RemoteCommand(command_type=CommandType.LOCK)
+        valid.mark_success(100)
+        entries = [
+            valid.to_dict(),
+            {'command_type': 'lock', 'status': 'success'},
+            dict(valid.to_dict(), command_id='not-a-uuid'),
+            dict(valid.to_dict(), command_type='warp_drive'),
+            ['not', 'a', 'dict'],
+        ]
+        (tmp_path / 'data').mkdir()
+        (tmp_path / 'data' / 'command_history.jsonl').write_text(
+            ''.join(json.dumps(entry) + '\n' for entry in entries) + '{torn'
+        )
+        
+        service = RemoteCommandMockService(vehicle_state=vehicle_state)
+        
+        assert service.get_command_status(valid.command_id).status == CommandStatus.SUCCESS
+        assert len(service._history) == 1
+    
+    def test_load_history_skips_non_string_command_id(self, vehicle_state, tmp_path):
+        """Test a history entry with a non-string command_id is skipped on load."""
+        import json
+        
+        valid = RemoteCommand(command_type=CommandType.LOCK)
+        valid.mark_success(100)
+        entries = [
+            dict(valid.to_dict(), command_id=123),
+            valid.to_dict(),
+        ]
+        (tmp_path / 'data').mkdir()
+        (tmp_path / 'data' / 'command_history.jsonl').write_text(
+            ''.join(json.dumps(entry) + '\n' for entry in entries)
+        )
+        
+        service = RemoteCommandMockService(vehicle_state=vehicle_state)
+        
+        assert service.get_command_status(valid.command_id).status == CommandStatus.SUCCESS
+        assert len(service._history) == 1
@@ -185,6 +185,53 @@ class TestCommandQueue:
         assert queue.size() == 2
         assert cmd2 not in queue.get_pending()
     
+    def test_dequeue_skips_removed_command(self):
+        """Test dequeue skips commands removed from the queue."""
+        queue = CommandQueue()
+        cmd1 = RemoteCommand(command_type=CommandType.LOCK)
+        cmd2 = RemoteCommand(command_type=CommandType.UNLOCK)
+        
+        queue.enqueue(cmd1)
+        queue.enqueue(cmd2)
+        queue.remove_by_id(cmd1.command_id)
+        
+        assert queue.dequeue() == cmd2
+        assert queue.dequeue() is None
+        assert queue.is_empty()
+    
+    def test_reenqueue_removed_command_keeps_fifo(self):
+        """Test a removed command enqueued again goes to the back of the queue."""
+        queue = CommandQueue()
+        cmd1 = RemoteCommand(command_type=CommandType.LOCK)
+        cmd2 = RemoteCommand(command_type=CommandType.UNLOCK)
+        
+        queue.enqueue(cmd1)
+        queue.enqueue(cmd2)
+        queue.remove_by_id(cmd1.command_id)
+        queue.enqueue(cmd1)
+        
+        assert queue.get_pending() == [cmd2, cmd1]
+        assert queue.dequeue() is cmd2
+        assert queue.dequeue() is cmd1
+        assert queue.dequeue() is None
+    
+    def test_reenqueue_pending_command_moves_it_to_back(self):
+        """Test enqueuing a pending command again leaves one entry at the back."""
+        queue = CommandQueue()
+        cmd1 = RemoteCommand(command_type=CommandType.LOCK)
+        cmd2 = RemoteCommand(command_type=CommandType.UNLOCK)
+        
+        queue.enqueue(cmd1)
+        queue.enqueue(cmd2)
+        queue.enqueue(cmd1)
+        
+        assert queue.size() == 2
+        assert queue.get_pending() == [cmd2, cmd1]
+        assert queue.dequeue() is cmd2
+        assert queue.dequeue() is cmd1
+        assert queue.dequeue() is None
+        assert queue.is_empty()
+    
     def test_remove_by_id_not_found(self):
         """Test remove_by_id returns False if command not in queue."""
         queue = CommandQueue()
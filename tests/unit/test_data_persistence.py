@@ -0,0 +1,122 @@
+"""
+Unit tests for data_persistence.
+
+Tests JSON reads and atomic writes with both JSON backends, and the command
+history log: appending, compaction, torn-line recovery and legacy migration.
+"""
+
+import json
+
+import pytest
+
+from services import data_persistence
+from services.data_persistence import (
+    safe_read_json, atomic_write_json,
+    save_command_history, append_command_history, load_command_history
+)
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def json_backend(request, monkeypatch):
+    """Run the test once with orjson (when installed) and once with stdlib json."""
+    if request.param == 'orjson':
+        if data_persistence.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(data_persistence, 'orjson', None)
+    return request.param
+
+
+def test_json_round_trip(tmp_path, json_backend):
+    """Test data written atomically reads back unchanged."""
+    path = tmp_path / 'state.json'
+    data = {'battery_soc': 75.5, 'lock_status': 'locked', 'tags': ['a', 'b'], 'note': '°C'}
+    
+    assert atomic_write_json(str(path), data) is True
+    
+    assert safe_read_json(str(path)) == data
+    assert json.loads(path.read_text(encoding='utf-8')) == data
+    assert not (tmp_path / 'state.json.tmp').exists()
+
+
+@pytest.mark.parametrize('contents', [None, b'', b'{"battery_soc": 7', b'\xff\xfe'])
+def test_read_missing_empty_or_corrupt_file_returns_default(tmp_path, json_backend, contents):
+    """Test unreadable files fall back to the default value."""
+    path = tmp_path / 'state.json'
+    if contents is not None:
+        path.write_bytes(contents)
+    
+    assert safe_read_json(str(path)) is None
+    assert safe_read_json(str(path), default={}) == {}
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    """Test a failed rename cleans up the temp file and keeps the original."""
+    path = tmp_path / 'state.json'
+    atomic_write_json(str(path), {'version': 1})
+    
+    def failing_replace(src, dst):
+        raise OSError("simulated rename failure")
+    
+    monkeypatch.setattr(data_persistence.os, 'replace', failing_replace)
+    
+    assert atomic_write_json(str(path), {'version': 2}) is False
+    assert not (tmp_path / 'state.json.tmp').exists()
+    assert safe_read_json(str(path)) == {'version': 1}
+
+
+def make_entry(index: int) -> dict:
+    """Create a minimal command history entry."""
+    return {'command_id': f'cmd-{index}', 'command_type': 'lock', 'status': 'success'}
+
+
+def test_append_adds_one_line_per_command(tmp_path):
+    """Test appends accumulate in log order."""
+    log = tmp_path / 'data' / 'command_history.jsonl'
+    
+    assert append_command_history([make_entry(1)], str(log)) is True
+    assert append_command_history([make_entry(2), make_entry(3)], str(log)) is True
+    
+    assert len(log.read_text().splitlines()) == 3
+    assert load_command_history(str(log)) == [make_entry(1), make_entry(2), make_entry(3)]
+
+
+def test_save_compacts_log(tmp_path):
+    """Test saving rewrites the log with exactly the given commands."""
+    log = tmp_path / 'command_history.jsonl'
+    append_command_history([make_entry(i) for i in range(5)], str(log))
+    
+    assert save_command_history([make_entry(4)], str(log)) is True
+    
+    assert load_command_history(str(log)) == [make_entry(4)]
+    assert not (tmp_path / 'command_history.jsonl.tmp').exists()
+
+
+def test_load_skips_torn_line(tmp_path):
+    """Test a partially written line is skipped and the rest still load."""
+    log = tmp_path / 'command_history.jsonl'
+    log.write_text(
+        json.dumps(make_entry(1)) + '\n'
+        + '{"command_id": "cmd-2", "sta\n'
+        + '\n'
+        + json.dumps(make_entry(3)) + '\n'
+    )
+    
+    assert load_command_history(str(log)) == [make_entry(1), make_entry(3)]
+
+
+def test_load_missing_log_returns_empty_list(tmp_path):
+    """Test loading before any history has been written."""
+    assert load_command_history(str(tmp_path / 'command_history.jsonl')) == []
+
+
+def test_load_migrates_legacy_json_history(tmp_path):
+    """Test history saved as a JSON array is moved into the log once."""
+    legacy = tmp_path / 'command_history.json'
+    legacy.write_text(json.dumps([make_entry(1), make_entry(2)]))
+    log = tmp_path / 'command_history.jsonl'
+    
+    assert load_command_history(str(log)) == [make_entry(1), make_entry(2)]
+    
+    assert not legacy.exists()
+    assert len(log.read_text().splitlines()) == 2
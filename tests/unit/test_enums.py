@@ -5,7 +5,7 @@ Tests CommandType, CommandStatus, and SeatHeatLevel enums.
 """
 
 import pytest
-from models.enums import CommandType, CommandStatus, SeatHeatLevel
+from models.enums import CommandType, CommandStatus, SeatHeatLevel, enum_from_value
 
 
 class TestCommandType:
@@ -103,3 +103,23 @@ class TestSeatHeatLevel:
         """Test that invalid string raises ValueError."""
         with pytest.raises(ValueError):
             SeatHeatLevel("extreme")
+
+
+class TestEnumFromValue:
+    """Tests for enum_from_value helper."""
+    
+    def test_resolves_known_values(self):
+        """Test known values resolve to their members."""
+        assert enum_from_value(SeatHeatLevel, "high") is SeatHeatLevel.HIGH
+        assert enum_from_value(CommandType, "lock") is CommandType.LOCK
+        assert enum_from_value(CommandStatus, "success") is CommandStatus.SUCCESS
+    
+    def test_unknown_value_raises_error(self):
+        """Test unknown values raise ValueError like the enum constructor."""
+        with pytest.raises(ValueError):
+            enum_from_value(SeatHeatLevel, "extreme")
+    
+    def test_unhashable_value_raises_error(self):
+        """Test unhashable values raise ValueError rather than TypeError."""
+        with pytest.raises(ValueError):
+            enum_from_value(SeatHeatLevel, ["high"])
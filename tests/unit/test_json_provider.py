@@ -0,0 +1,58 @@
+"""
+Unit tests for the orjson-backed Flask JSON provider.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from services import json_provider
+from services.json_provider import OrjsonProvider
+
+
+def test_dumps_matches_default_provider():
+    """Test compact output matches Flask's default provider."""
+    app = Flask(__name__)
+    provider = OrjsonProvider(app)
+    default = DefaultJSONProvider(app)
+    data = {
+        'success': True,
+        'data': {'soc': 75.5, 'id': UUID('550e8400-e29b-41d4-a716-446655440000')},
+        'when': datetime(2024, 1, 15, 10, 30, 0),
+        'alpha': [1, 2, None]
+    }
+    
+    assert provider.loads(provider.dumps(data, separators=(',', ':'))) == \
+        default.loads(default.dumps(data, separators=(',', ':')))
+
+
+def test_dumps_sorts_keys():
+    """Test keys are sorted like the default provider."""
+    provider = OrjsonProvider(Flask(__name__))
+    
+    assert provider.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+
+
+def test_loads_bytes():
+    """Test loads accepts UTF-8 bytes."""
+    provider = OrjsonProvider(Flask(__name__))
+    
+    assert provider.loads(b'{"temperature": 22.5}') == {'temperature': 22.5}
+
+
+def test_falls_back_to_default_provider_without_orjson(monkeypatch):
+    """Test the stdlib path is used when orjson is not installed."""
+    monkeypatch.setattr(json_provider, 'orjson', None)
+    app = Flask(__name__)
+    provider = OrjsonProvider(app)
+    default = DefaultJSONProvider(app)
+    data = {
+        'success': True,
+        'id': UUID('550e8400-e29b-41d4-a716-446655440000'),
+        'when': datetime(2024, 1, 15, 10, 30, 0)
+    }
+    
+    assert provider.dumps(data) == default.dumps(data)
+    assert provider.loads(b'{"temperature": 22.5}') == {'temperature': 22.5}
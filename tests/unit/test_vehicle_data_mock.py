@@ -80,6 +80,16 @@ def test_set_scenario():
     assert state2.battery_soc < normal_soc
 
 
+def test_get_vehicle_state_reuses_scenario_state():
+    """Test repeated reads share one generated scenario state."""
+    service = VehicleDataMockService(delay_seconds=0.0, scenario='normal')
+    
+    state1 = service.get_vehicle_state()
+    state2 = service.get_vehicle_state()
+    
+    assert state1 is state2
+
+
 def test_set_failure_rate():
     """Test setting failure rate."""
     service = VehicleDataMockService(delay_seconds=0.0)